@@ -10,20 +10,53 @@ Key Concepts:
 - FIFO queue in token: Ensures fairness by tracking waiting nodes
 """
 
-from typing import Dict, List, Set, Optional
+from typing import Deque, Dict, List, Optional, Sequence, Set, Tuple
 from collections import deque
+from itertools import islice
 import time
 
 
+# Message type codes stored in the message log
+MSG_REQUEST = 0
+MSG_TOKEN = 1
+_MSG_TYPE_NAMES = ('REQUEST', 'TOKEN')
+
+
+def _find_new_queued(request_number: List[int], last_request: List[int],
+                     queued: Set[int]) -> List[int]:
+    """
+    Find nodes with an outstanding request that are not yet in the token queue.
+    
+    A node i has an outstanding request when RN[i] == LN[i] + 1. The caller
+    sets LN[holder] = RN[holder] first, so the token holder never matches and
+    needs no per-element exclusion.
+    
+    Args:
+        request_number (List[int]): Request numbers known to the token holder
+        last_request (List[int]): Token's last executed request numbers
+        queued (Set[int]): Node IDs already waiting in the token queue
+        
+    Returns:
+        List[int]: Node IDs to append to the token queue, in ascending order
+    """
+    return [
+        i for i, (rn, ln) in enumerate(zip(request_number, last_request))
+        if rn == ln + 1 and i not in queued
+    ]
+
+
 class Token:
     """
     Represents the token circulating in the Suzuki-Kasami algorithm.
     
     Attributes:
         queue (deque): FIFO queue of node IDs waiting for the token
-        last_request (Dict[int, int]): Maps node_id to sequence number of last executed request
+        last_request (List[int]): Sequence number of last executed request, indexed by node_id
+        queued (Set[int]): Node IDs currently in the queue, for O(1) membership tests
     """
     
+    __slots__ = ('queue', 'last_request', 'queued')
+    
     def __init__(self, num_nodes: int):
         """
         Initialize the token.
@@ -32,7 +65,8 @@ class Token:
             num_nodes (int): Total number of nodes in the system
         """
         self.queue = deque()  # Queue of waiting nodes
-        self.last_request: Dict[int, int] = {i: 0 for i in range(num_nodes)}
+        self.last_request: List[int] = [0] * num_nodes
+        self.queued: Set[int] = set()  # Mirrors queue contents
     
     def __repr__(self):
         return f"Token(queue={list(self.queue)}, last_request={self.last_request})"
@@ -49,6 +83,9 @@ class Node:
     - request_sequence: Local sequence number for this node's requests
     """
     
+    __slots__ = ('node_id', 'num_nodes', 'request_number', 'has_token', 'token',
+                 'request_sequence', 'in_critical_section', 'pending_requests')
+    
     def __init__(self, node_id: int, num_nodes: int):
         """
         Initialize a node.
@@ -59,12 +96,12 @@ class Node:
         """
         self.node_id = node_id
         self.num_nodes = num_nodes
-        self.request_number: Dict[int, int] = {i: 0 for i in range(num_nodes)}
+        self.request_number: List[int] = [0] * num_nodes
         self.has_token = False
         self.token: Optional[Token] = None
         self.request_sequence = 0
         self.in_critical_section = False
-        self.pending_requests: Set[int] = set()  # Track which nodes have requested
+        self.pending_requests = bytearray(num_nodes)  # pending_requests[i] == 1 if node i has requested
         
     def request_critical_section(self) -> Dict:
         """
@@ -96,20 +133,19 @@ class Node:
         sequence = request['sequence']
         
         # Update request number for sender
-        self.request_number[sender_id] = max(
-            self.request_number[sender_id], 
-            sequence
-        )
-        
-        # If this node has the token and is not using it
-        if self.has_token and not self.in_critical_section:
-            # Check if sender's request hasn't been satisfied
-            if self.token and self.token.last_request[sender_id] + 1 == sequence:
-                return self._send_token(sender_id)
-        else:
-            # Track pending request
-            self.pending_requests.add(sender_id)
-        
+        request_number = self.request_number
+        if sequence > request_number[sender_id]:
+            request_number[sender_id] = sequence
+        
+        # Send the token if this node holds it, is not using it, and the
+        # sender's request hasn't been satisfied yet
+        idle_holder = self.has_token and not self.in_critical_section
+        if idle_holder and self.token.last_request[sender_id] + 1 == sequence:
+            return self._send_token(sender_id)
+        
+        # A node without the token, or still using it, tracks the request
+        if not idle_holder:
+            self.pending_requests[sender_id] = 1
         return None
     
     def enter_critical_section(self) -> bool:
@@ -124,12 +160,12 @@ class Node:
             return True
         return False
     
-    def exit_critical_section(self) -> Optional[Dict]:
+    def exit_critical_section(self) -> Optional[Tuple[Token, int]]:
         """
         Exit the critical section and potentially send token to next waiting node.
         
         Returns:
-            Optional[Dict]: Message containing token and recipient, or None
+            Optional[Tuple[Token, int]]: Token being sent and ID of its recipient, or None
         """
         if not self.in_critical_section:
             return None
@@ -137,21 +173,25 @@ class Node:
         self.in_critical_section = False
         
         # Update token's last_request for this node
-        if self.token:
-            self.token.last_request[self.node_id] = self.request_number[self.node_id]
+        token = self.token
+        if token:
+            node_id = self.node_id
+            request_number = self.request_number
+            last_request = token.last_request
+            queue = token.queue
+            queued = token.queued
+            last_request[node_id] = request_number[node_id]
             
             # Find nodes that have outstanding requests
-            for i in range(self.num_nodes):
-                if i != self.node_id:
-                    # If node i has a request not yet satisfied
-                    if (self.request_number[i] == self.token.last_request[i] + 1 and
-                        i not in [item for item in self.token.queue]):
-                        self.token.queue.append(i)
+            for i in _find_new_queued(request_number, last_request, queued):
+                queue.append(i)
+                queued.add(i)
             
             # Send token to next waiting node if any
-            if self.token.queue:
-                next_node = self.token.queue.popleft()
-                return self._send_token(next_node)
+            if queue:
+                next_node = queue.popleft()
+                queued.discard(next_node)
+                return self._send_token(next_node), next_node
         
         return None
     
@@ -168,7 +208,7 @@ class Node:
         token_to_send = self.token
         self.token = None
         self.has_token = False
-        self.pending_requests.discard(recipient_id)
+        self.pending_requests[recipient_id] = 0
         return token_to_send
     
     def receive_token(self, token: Token):
@@ -193,13 +233,16 @@ class SuzukiKasami:
     mutual exclusion protocol.
     """
     
-    def __init__(self, num_nodes: int, initial_token_holder: int = 0):
+    def __init__(self, num_nodes: int, initial_token_holder: int = 0,
+                 log_capacity: Optional[int] = 10_000):
         """
         Initialize the Suzuki-Kasami algorithm with multiple nodes.
         
         Args:
             num_nodes (int): Number of nodes in the distributed system
             initial_token_holder (int): ID of node that initially holds the token
+            log_capacity (Optional[int]): Number of most recent entries kept in each
+                log; None keeps everything
         """
         if num_nodes < 2:
             raise ValueError("At least 2 nodes are required")
@@ -208,13 +251,51 @@ class SuzukiKasami:
         
         self.num_nodes = num_nodes
         self.nodes: List[Node] = [Node(i, num_nodes) for i in range(num_nodes)]
+        # Row k is node k's request_number list / pending bitmap (shared, not copied)
+        self.request_numbers: List[List[int]] = [node.request_number for node in self.nodes]
+        self.pending_requests: List[bytearray] = [node.pending_requests for node in self.nodes]
         
         # Assign initial token
         initial_token = Token(num_nodes)
         self.nodes[initial_token_holder].receive_token(initial_token)
+        self.token_holder = initial_token_holder  # ID of node currently holding the token
+        
+        # When False, result dicts carry empty 'message' strings and 'responses' lists
+        self.verbose = True
+        
+        # Message log stored column-wise in bounded ring buffers;
+        # see get_message_log() for the dict view
+        self.log_enabled = True
+        self.msg_type: Deque[int] = deque(maxlen=log_capacity)
+        self.msg_from: Deque[int] = deque(maxlen=log_capacity)
+        self.msg_to: Deque[int] = deque(maxlen=log_capacity)   # -1 for REQUEST messages
+        self.msg_seq: Deque[int] = deque(maxlen=log_capacity)  # -1 for TOKEN messages
+        self.msg_ts: Deque[int] = deque(maxlen=log_capacity)   # time.time_ns() at logging time
+        self.cs_access_log: Deque[Dict] = deque(maxlen=log_capacity)
+        
+        # Running totals, unaffected by log_capacity or log_enabled
+        self.total_messages = 0
+        self.cs_accesses = 0
+    
+    def _log_message(self, msg_type: int, from_id: int, to_id: int = -1, sequence: int = -1):
+        """
+        Count one message and, if logging is enabled, append it to the
+        column-wise message log.
         
-        self.message_log: List[Dict] = []
-        self.cs_access_log: List[Dict] = []
+        Args:
+            msg_type (int): MSG_REQUEST or MSG_TOKEN
+            from_id (int): Sending node ID
+            to_id (int): Receiving node ID (TOKEN messages only)
+            sequence (int): Request sequence number (REQUEST messages only)
+        """
+        self.total_messages += 1
+        if not self.log_enabled:
+            return
+        self.msg_type.append(msg_type)
+        self.msg_from.append(from_id)
+        self.msg_to.append(to_id)
+        self.msg_seq.append(sequence)
+        self.msg_ts.append(time.time_ns())
     
     def request_critical_section(self, node_id: int) -> Dict:
         """
@@ -234,34 +315,40 @@ class SuzukiKasami:
         # Generate REQUEST message
         request_msg = node.request_critical_section()
         
-        # Broadcast to all other nodes
+        sequence = request_msg['sequence']
+        
+        # Broadcast: record the request in every node's RN and pending bitmap
+        # in one pass; only the token holder needs to answer
+        holder_id = self.token_holder
+        pending_rows = self.pending_requests
+        holder_pending = pending_rows[holder_id][node_id]
+        for request_number, pending in zip(self.request_numbers, pending_rows):
+            if sequence > request_number[node_id]:
+                request_number[node_id] = sequence
+            pending[node_id] = 1
+        
+        # The requester never tracks itself; the holder decides in receive_request
+        pending_rows[node_id][node_id] = 0
+        pending_rows[holder_id][node_id] = holder_pending
+        
         responses = []
-        for i, other_node in enumerate(self.nodes):
-            if i != node_id:
-                token_received = other_node.receive_request(request_msg)
-                if token_received:
-                    # Token is being sent to requester
-                    node.receive_token(token_received)
-                    self.message_log.append({
-                        'type': 'TOKEN',
-                        'from': i,
-                        'to': node_id,
-                        'timestamp': time.time()
-                    })
-                    responses.append(f"Received token from Node{i}")
-        
-        self.message_log.append({
-            'type': 'REQUEST',
-            'from': node_id,
-            'sequence': request_msg['sequence'],
-            'timestamp': time.time()
-        })
+        if holder_id != node_id:
+            token_received = self.nodes[holder_id].receive_request(request_msg)
+            if token_received:
+                # Token is being sent to requester
+                node.receive_token(token_received)
+                self.token_holder = node_id
+                self._log_message(MSG_TOKEN, holder_id, to_id=node_id)
+                if self.verbose:
+                    responses.append(f"Received token from Node{holder_id}")
+        
+        self._log_message(MSG_REQUEST, node_id, sequence=sequence)
         
         return {
             'success': True,
             'has_token': node.has_token,
             'responses': responses,
-            'message': f"Node{node_id} broadcasted request (seq={request_msg['sequence']})"
+            'message': f"Node{node_id} broadcasted request (seq={sequence})" if self.verbose else ""
         }
     
     def enter_critical_section(self, node_id: int) -> Dict:
@@ -281,20 +368,22 @@ class SuzukiKasami:
         success = node.enter_critical_section()
         
         if success:
-            entry = {
-                'node_id': node_id,
-                'action': 'ENTER',
-                'timestamp': time.time()
-            }
-            self.cs_access_log.append(entry)
+            self.cs_accesses += 1
+            if self.log_enabled:
+                self.cs_access_log.append({
+                    'node_id': node_id,
+                    'action': 'ENTER',
+                    'timestamp': time.time()
+                })
             return {
                 'success': True,
-                'message': f"Node{node_id} entered critical section"
+                'message': f"Node{node_id} entered critical section" if self.verbose else ""
             }
         else:
             return {
                 'success': False,
-                'message': f"Node{node_id} cannot enter (no token or already in CS)"
+                'message': (f"Node{node_id} cannot enter (no token or already in CS)"
+                            if self.verbose else "")
             }
     
     def exit_critical_section(self, node_id: int) -> Dict:
@@ -313,34 +402,28 @@ class SuzukiKasami:
         node = self.nodes[node_id]
         token_transfer = node.exit_critical_section()
         
-        exit_entry = {
-            'node_id': node_id,
-            'action': 'EXIT',
-            'timestamp': time.time()
-        }
-        self.cs_access_log.append(exit_entry)
+        self.cs_accesses += 1
+        if self.log_enabled:
+            self.cs_access_log.append({
+                'node_id': node_id,
+                'action': 'EXIT',
+                'timestamp': time.time()
+            })
         
         result = {
             'success': True,
-            'message': f"Node{node_id} exited critical section"
+            'message': f"Node{node_id} exited critical section" if self.verbose else ""
         }
         
         if token_transfer:
-            # Find recipient and send token
-            for i, other_node in enumerate(self.nodes):
-                if not other_node.has_token and i != node_id:
-                    # Check if this node should receive the token
-                    if other_node.request_number[i] == token_transfer.last_request[i] + 1:
-                        other_node.receive_token(token_transfer)
-                        self.message_log.append({
-                            'type': 'TOKEN',
-                            'from': node_id,
-                            'to': i,
-                            'timestamp': time.time()
-                        })
-                        result['token_sent_to'] = i
-                        result['message'] += f" and sent token to Node{i}"
-                        break
+            # Deliver token directly to the node chosen from the token queue
+            token, recipient_id = token_transfer
+            self.nodes[recipient_id].receive_token(token)
+            self.token_holder = recipient_id
+            self._log_message(MSG_TOKEN, node_id, to_id=recipient_id)
+            result['token_sent_to'] = recipient_id
+            if self.verbose:
+                result['message'] += f" and sent token to Node{recipient_id}"
         
         return result
     
@@ -363,24 +446,42 @@ class SuzukiKasami:
                 }
                 for node in self.nodes
             ],
-            'total_messages': len(self.message_log),
-            'cs_accesses': len(self.cs_access_log)
+            'total_messages': self.total_messages,
+            'cs_accesses': self.cs_accesses
         }
     
-    def get_message_log(self) -> List[Dict]:
+    def get_message_log(self, last_n: Optional[int] = None) -> List[Dict]:
         """
-        Get the log of all messages exchanged.
+        Get the message log: the most recent log_capacity messages exchanged.
         
+        Args:
+            last_n (Optional[int]): Only build the most recent last_n messages
+            
         Returns:
-            List[Dict]: List of all messages
+            List[Dict]: Retained messages, oldest first (or the last_n most recent)
         """
-        return self.message_log.copy()
+        start = max(len(self.msg_type) - last_n, 0) if last_n else 0
+        columns = zip(self.msg_type, self.msg_from, self.msg_to, self.msg_seq, self.msg_ts)
+        messages = []
+        for msg_type, from_id, to_id, sequence, ts in islice(columns, start, None):
+            msg = {'type': _MSG_TYPE_NAMES[msg_type], 'from': from_id}
+            if msg_type == MSG_TOKEN:
+                msg['to'] = to_id
+            else:
+                msg['sequence'] = sequence
+            msg['timestamp'] = ts / 1e9
+            messages.append(msg)
+        return messages
     
-    def get_cs_access_log(self) -> List[Dict]:
+    def get_cs_access_log(self, copy: bool = True) -> Sequence[Dict]:
         """
-        Get the log of all critical section accesses.
+        Get the CS access log: the most recent log_capacity entries and exits.
         
+        Args:
+            copy (bool): Return a snapshot list; if False, return the live
+                log deque, which callers must treat as read-only
+            
         Returns:
-            List[Dict]: List of all CS entries and exits
+            Sequence[Dict]: Retained CS entries and exits, oldest first
         """
-        return self.cs_access_log.copy()
+        return list(self.cs_access_log) if copy else self.cs_access_log
@@ -12,41 +12,53 @@ from algorithm import SuzukiKasami
 import time
 
 
-def print_separator(char='-', length=60):
+SEPARATOR_CHAR = '-'
+SEPARATOR_LENGTH = 60
+SEPARATOR = SEPARATOR_CHAR * SEPARATOR_LENGTH
+
+
+def print_separator(char=SEPARATOR_CHAR, length=SEPARATOR_LENGTH):
     """Print a separator line."""
     print(char * length)
 
 
-def display_system_state(sk_system: SuzukiKasami):
-    """Display the current state of the system."""
+def display_system_state(sk_system: SuzukiKasami, verbose: bool = True):
+    """Display the current state of the system (skipped entirely if not verbose)."""
+    if not verbose:
+        return
+    
     state = sk_system.get_system_state()
-    print("\n" + "="*60)
-    print("SYSTEM STATE")
-    print("="*60)
-    print(f"Number of Nodes: {state['num_nodes']}")
-    print(f"Total Messages Sent: {state['total_messages']}")
-    print(f"Critical Section Accesses: {state['cs_accesses']}")
-    print("\nNode Status:")
-    print_separator()
+    lines = [
+        "\n" + "="*60,
+        "SYSTEM STATE",
+        "="*60,
+        f"Number of Nodes: {state['num_nodes']}",
+        f"Total Messages Sent: {state['total_messages']}",
+        f"Critical Section Accesses: {state['cs_accesses']}",
+        "\nNode Status:",
+        SEPARATOR,
+    ]
     for node_info in state['nodes']:
         token_status = "✓ HAS TOKEN" if node_info['has_token'] else "  No token"
         cs_status = "IN CS" if node_info['in_critical_section'] else "     "
-        queue_info = f"Queue: {node_info['token_queue']}" if node_info['token_queue'] else ""
-        print(f"  Node {node_info['node_id']}: {token_status} | {cs_status} | "
-              f"Req Seq: {node_info['request_sequence']} {queue_info}")
-    print_separator()
+        token_queue = node_info['token_queue']
+        queue_info = f"Queue: {token_queue}" if token_queue else ""
+        lines.append(f"  Node {node_info['node_id']}: {token_status} | {cs_status} | "
+                     f"Req Seq: {node_info['request_sequence']} {queue_info}")
+    lines.append(SEPARATOR)
+    print("\n".join(lines))
 
 
 def display_message_log(sk_system: SuzukiKasami, last_n: int = 10):
     """Display recent messages."""
-    messages = sk_system.get_message_log()
+    messages = sk_system.get_message_log(last_n=last_n)
     if not messages:
         print("\nNo messages exchanged yet.")
         return
     
     print(f"\nMessage Log (last {last_n}):")
     print_separator()
-    for msg in messages[-last_n:]:
+    for msg in messages:
         if msg['type'] == 'REQUEST':
             print(f"  [{msg['type']}] Node{msg['from']} broadcasted request (seq={msg['sequence']})")
         elif msg['type'] == 'TOKEN':
@@ -56,7 +68,7 @@ def display_message_log(sk_system: SuzukiKasami, last_n: int = 10):
 
 def display_cs_log(sk_system: SuzukiKasami):
     """Display critical section access log."""
-    log = sk_system.get_cs_access_log()
+    log = sk_system.get_cs_access_log(copy=False)
     if not log:
         print("\nNo critical section accesses yet.")
         return
@@ -221,6 +233,13 @@ def interactive_mode():
     print("  l - Show CS access log")
     print("  q - Quit")
     
+    # Node commands dispatched by table lookup
+    node_commands = {
+        'r': sk.request_critical_section,
+        'e': sk.enter_critical_section,
+        'x': sk.exit_critical_section,
+    }
+    
     while True:
         try:
             command = input("\n> ").strip().split()
@@ -228,8 +247,23 @@ def interactive_mode():
                 continue
             
             cmd = command[0].lower()
+            action = node_commands.get(cmd)
+            
+            if action is not None:
+                if len(command) < 2:
+                    print("Please specify node ID")
+                    continue
+                
+                try:
+                    node_id = int(command[1])
+                except ValueError:
+                    print("Invalid node ID")
+                    continue
+                
+                result = action(node_id)
+                print(f"Output: {result}")
             
-            if cmd == 'q':
+            elif cmd == 'q':
                 print("Exiting interactive mode.")
                 break
             
@@ -242,29 +276,6 @@ def interactive_mode():
             elif cmd == 'l':
                 display_cs_log(sk)
             
-            elif cmd in ['r', 'e', 'x']:
-                if len(command) < 2:
-                    print("Please specify node ID")
-                    continue
-                
-                try:
-                    node_id = int(command[1])
-                    
-                    if cmd == 'r':
-                        result = sk.request_critical_section(node_id)
-                        print(f"Output: {result}")
-                    
-                    elif cmd == 'e':
-                        result = sk.enter_critical_section(node_id)
-                        print(f"Output: {result}")
-                    
-                    elif cmd == 'x':
-                        result = sk.exit_critical_section(node_id)
-                        print(f"Output: {result}")
-                
-                except ValueError:
-                    print("Invalid node ID")
-            
             else:
                 print("Unknown command")
         
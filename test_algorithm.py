@@ -0,0 +1,39 @@
+"""
+Regression checks for the Suzuki-Kasami implementation in algorithm.py.
+
+Usage:
+    python -m unittest test_algorithm
+"""
+
+import unittest
+
+from algorithm import SuzukiKasami
+
+
+class TokenDispatchTest(unittest.TestCase):
+    """The exiting node must hand the token to the head of the token queue."""
+
+    def test_token_goes_to_queue_head_not_lowest_requester(self):
+        sk = SuzukiKasami(num_nodes=4, initial_token_holder=0)
+
+        # Node0 in CS while Node2 and Node3 request -> queue [2, 3], token to Node2
+        sk.enter_critical_section(0)
+        sk.request_critical_section(2)
+        sk.request_critical_section(3)
+        sk.exit_critical_section(0)
+
+        # Node1 requests while Node2 is in CS -> queue [3, 1]
+        sk.enter_critical_section(2)
+        sk.request_critical_section(1)
+        result = sk.exit_critical_section(2)
+
+        # Node3 was queued first, so it gets the token ahead of Node1
+        self.assertEqual(result['token_sent_to'], 3)
+        self.assertEqual(sk.token_holder, 3)
+        state = sk.get_system_state()
+        self.assertTrue(state['nodes'][3]['has_token'])
+        self.assertEqual(state['nodes'][3]['token_queue'], [1])
+
+
+if __name__ == '__main__':
+    unittest.main()